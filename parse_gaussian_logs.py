@@ -4,20 +4,46 @@
 from __future__ import annotations
 
 import argparse
-import json
+import contextlib
+import fnmatch
+import hashlib
 import logging
+import math
+import multiprocessing
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import date, datetime, time, timedelta
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Union
 
-from cclib.io import ccread
+import numpy as np
+import orjson
 from tqdm import tqdm
 
 DEFAULT_INPUT_DIR = Path("./out_molecules/cid_75")
 DEFAULT_PATTERN = "*.log"
+DEFAULT_CACHE_DIR = Path("./out_molecules_json/.cache")
+# Bump whenever extract_record changes the fields or values it records
+CACHE_VERSION = 1
+DEFAULT_PARSER = "auto"
+PARSER_CHOICES = ("auto", "gaussian")
+DEFAULT_FORMAT = "jsonl"
+FORMAT_CHOICES = ("json", "jsonl")
+# Number of stat() calls kept in flight while resolving cache entries
+STAT_CONCURRENCY = 64
 EV_PER_HARTREE = 27.211386245988
+HARTREE_PER_EV = 1.0 / EV_PER_HARTREE
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+StrPath = Union[str, "os.PathLike[str]"]
+
+# cclib is slow to import, so readers are loaded on first use (or eagerly by
+# the worker initializer) rather than at module import time.
+_READERS: Dict[str, Callable[[Any], Any]] = {}
 
 
 def build_argument_parser() -> argparse.ArgumentParser:
@@ -42,122 +68,376 @@ def build_argument_parser() -> argparse.ArgumentParser:
         "--output",
         type=Path,
         default=None,
-        help="Destination JSON file. Defaults to out_molecules_json/out_molecules.json",
+        help="Destination file. Defaults to out_molecules_json/out_molecules.jsonl (or .json with --format json)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMAT_CHOICES,
+        default=None,
+        help=(
+            "Aggregated output format: one JSON array, or JSON Lines with one record per line "
+            "(default: json if --output ends in .json, otherwise jsonl)"
+        ),
     )
     parser.add_argument(
         "--separate",
         action="store_true",
         help="Create separate JSON file for each log file instead of aggregating into one file",
     )
+    parser.add_argument(
+        "--parser",
+        choices=PARSER_CHOICES,
+        default=DEFAULT_PARSER,
+        help="cclib parser to use; 'gaussian' skips file type detection (default: auto)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for cached per-file parse results (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse log files instead of reusing cached results",
+    )
     return parser
 
 
-def safe_get(obj: Any, name: str, default: Any = None) -> Any:
-    return getattr(obj, name, default) if hasattr(obj, name) else default
+def get_reader(parser: str = DEFAULT_PARSER) -> Callable[[Any], Any]:
+    """Return the cclib reader for ``parser``: ccread for "auto", cclib's Gaussian parser for "gaussian"."""
+    reader = _READERS.get(parser)
+    if reader is None:
+        if parser == "gaussian":
+            from cclib.parser import Gaussian
 
+            def reader(source: Any) -> Any:
+                return Gaussian(source).parse()
 
-def to_python(value: Any) -> Any:
-    if hasattr(value, "tolist"):
-        return value.tolist()
+        elif parser == "auto":
+            from cclib.io import ccread
+
+            reader = ccread
+        else:
+            raise ValueError(f"Unknown parser: {parser}")
+        _READERS[parser] = reader
+    return reader
+
+
+@dataclass(slots=True)
+class Record:
+    """Parsed result for one log file; a failed one carries only ``file`` and ``error``."""
+
+    file: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    charge: Optional[float] = None
+    multiplicity: Optional[int] = None
+    nbasis: Optional[int] = None
+    natoms: Optional[int] = None
+    scf_energies_au: Optional[List[float]] = None
+    final_scf_energy_au: Optional[float] = None
+    vibrations: Optional[Dict[str, Any]] = None
+    dipole_moment_debye: Optional[Dict[str, float]] = None
+    mulliken_charges: Optional[List[float]] = None
+    zpe_au: Optional[float] = None
+    atom_numbers: Any = None
+    final_geometry_angstrom: Any = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self.error is not None:
+            return {"file": self.file, "error": self.error}
+        return {name: getattr(self, name) for name in _RECORD_FIELDS}
+
+
+_RECORD_FIELDS = tuple(f.name for f in fields(Record) if f.name != "error")
+
+
+@dataclass(slots=True, frozen=True)
+class LogJob:
+    """A log file to parse; ``cached`` says whether ``cache_file`` is expected to exist."""
+
+    path: str
+    name: str
+    stem: str
+    cache_file: Optional[str] = None
+    cached: bool = False
+
+    @classmethod
+    def for_path(cls, path: Path, cache_file: Optional[Path] = None, cached: bool = False) -> "LogJob":
+        return cls(
+            os.fspath(path),
+            path.name,
+            path.stem,
+            os.fspath(cache_file) if cache_file is not None else None,
+            cached,
+        )
+
+
+def _opt_float(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _opt_int(value: Any) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def _identity(value: Any) -> Any:
     return value
 
 
+def _isoformat(value: Any) -> str:
+    return value.isoformat()
+
+
+def _serialize_dict(value: Dict[Any, Any]) -> Dict[Any, Any]:
+    return {k: to_serializable(v) for k, v in value.items()}
+
+
+def _serialize_sequence(value: Iterable[Any]) -> List[Any]:
+    return [to_serializable(v) for v in value]
+
+
+_JSON_SCALAR_TYPES = frozenset({bool, int, float, str, type(None)})
+
+
+def _serialize_list(value: List[Any]) -> List[Any]:
+    # Lists of plain scalars (energies, charges) are returned as-is, not copied
+    if all(type(v) in _JSON_SCALAR_TYPES for v in value):
+        return value
+    return [to_serializable(v) for v in value]
+
+
+def _serialize_ndarray(value: np.ndarray) -> Any:
+    # tolist() already yields Python scalars unless the array holds objects
+    return value.tolist() if value.dtype.kind != "O" else to_serializable(value.tolist())
+
+
+# Exact-type fast path for to_serializable; subclasses fall through to the
+# isinstance checks below.
+_SERIALIZERS: Dict[type, Callable[[Any], Any]] = {
+    type(None): _identity,
+    bool: _identity,
+    int: _identity,
+    float: _identity,
+    str: _identity,
+    dict: _serialize_dict,
+    list: _serialize_list,
+    tuple: _serialize_sequence,
+    set: _serialize_sequence,
+    np.ndarray: _serialize_ndarray,
+    datetime: _isoformat,
+    date: _isoformat,
+    time: _isoformat,
+    timedelta: timedelta.total_seconds,
+    type(Path()): str,
+}
+
+
 def to_serializable(value: Any) -> Any:
-    if value is None:
-        return None
+    serializer = _SERIALIZERS.get(type(value))
+    if serializer is not None:
+        return serializer(value)
     if isinstance(value, (bool, int, float, str)):
         return value
-    if isinstance(value, (datetime, date)):
-        return value.isoformat()
-    if isinstance(value, time):
+    if isinstance(value, (datetime, date, time)):
         return value.isoformat()
     if isinstance(value, timedelta):
         return value.total_seconds()
     if isinstance(value, Path):
         return str(value)
+    if isinstance(value, np.generic):
+        return value.item()
     if hasattr(value, "tolist"):
         return to_serializable(value.tolist())
     if isinstance(value, dict):
-        return {k: to_serializable(v) for k, v in value.items()}
+        return _serialize_dict(value)
     if isinstance(value, (list, tuple, set)):
-        return [to_serializable(v) for v in value]
-    # numpy scalar types
+        return _serialize_sequence(value)
+    return str(value)
+
+
+def cache_path_for(
+    path: Path, cache_dir: Path, parser: str = DEFAULT_PARSER
+) -> Optional[Path]:
+    """Return ``<stem>.<path hash>.<parser>.v<version>.<mtime_ns>.<size>.json``, or None if stat() fails."""
     try:
-        import numpy as np  # type: ignore
+        st = path.stat()
+    except OSError:
+        return None
+    digest = hashlib.sha1(os.fsencode(os.path.abspath(path))).hexdigest()[:16]
+    return cache_dir / f"{path.stem}.{digest}.{parser}.v{CACHE_VERSION}.{st.st_mtime_ns}.{st.st_size}.json"
 
-        if isinstance(value, np.generic):
-            return value.item()
-    except ModuleNotFoundError:
-        pass
-    return str(value)
+
+def _cache_entry_source(name: str) -> str:
+    # Strip "v<version>.<mtime_ns>.<size>.json", leaving the part naming the source file
+    return name.rsplit(".", 4)[0]
+
+
+def remove_stale_cache_entries(cache_dir: Path, current: Dict[str, str], names: Iterable[str]) -> None:
+    """Delete entries in ``names`` superseded by ``current`` (source key -> entry name)."""
+    for name in names:
+        if not name.endswith(".json"):
+            continue
+        keep = current.get(_cache_entry_source(name))
+        if keep is not None and keep != name:
+            with contextlib.suppress(OSError):
+                os.remove(cache_dir / name)
+
+
+def load_cached_record(cache_file: StrPath) -> Optional[Record]:
+    try:
+        with open(cache_file, "rb") as f:
+            return Record(**orjson.loads(f.read()))
+    except FileNotFoundError:
+        return None
+    except (OSError, TypeError, orjson.JSONDecodeError) as exc:
+        logging.warning("Ignoring unreadable cache file %s: %s", cache_file, exc)
+        return None
+
+
+def store_cached_record(cache_file: StrPath, record: Record) -> None:
+    # Write to a private temporary file and rename it into place so that a
+    # concurrent reader never sees a partially written cache entry.
+    tmp_file = f"{os.fspath(cache_file)}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    record.to_dict(), option=orjson.OPT_SERIALIZE_NUMPY, default=to_serializable
+                )
+            )
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError) as exc:
+        logging.warning("Failed to write cache file %s: %s", cache_file, exc)
+        with contextlib.suppress(OSError):
+            os.remove(tmp_file)
+
+
+def plan_jobs(
+    files: List[Path], cache_dir: Optional[Path], parser: str = DEFAULT_PARSER
+) -> List[LogJob]:
+    """Resolve the cache entry of every file before dispatching work."""
+    if cache_dir is None:
+        return [LogJob.for_path(path) for path in files]
+    try:
+        with os.scandir(cache_dir) as it:
+            existing = {entry.name for entry in it}
+    except FileNotFoundError:
+        existing = set()
+    with ThreadPoolExecutor(max_workers=STAT_CONCURRENCY) as pool:
+        cache_files = list(pool.map(partial(cache_path_for, cache_dir=cache_dir, parser=parser), files))
+    current = {
+        _cache_entry_source(cache_file.name): cache_file.name
+        for cache_file in cache_files
+        if cache_file is not None
+    }
+    remove_stale_cache_entries(cache_dir, current, existing)
+    return [
+        LogJob.for_path(path, cache_file, cache_file is not None and cache_file.name in existing)
+        for path, cache_file in zip(files, cache_files)
+    ]
+
+
+def run_job(job: LogJob, parser: str = DEFAULT_PARSER) -> Record:
+    if job.cached:
+        cached = load_cached_record(job.cache_file)
+        if cached is not None:
+            return cached
+
+    record = extract_record(job.path, parser, job.name)
+    if job.cache_file is not None and record.error is None:
+        store_cached_record(job.cache_file, record)
+    return record
+
+
+def parse_single_log(
+    path: Path, cache_dir: Optional[Path] = None, parser: str = DEFAULT_PARSER
+) -> Record:
+    """Parse one log, or reuse its cached record (lists/floats in place of ndarrays/timedeltas)."""
+    cache_file = cache_path_for(path, cache_dir, parser) if cache_dir is not None else None
+    return run_job(LogJob.for_path(path, cache_file, cache_file is not None), parser)
+
+
+def parse_and_serialize(job: LogJob, output_dir: str, parser: str = DEFAULT_PARSER) -> str:
+    """Parse one log file and write it to its own JSON file, returning that path."""
+    record = run_job(job, parser)
+    output_file = os.path.join(output_dir, f"{job.stem}.cclib.json")
+    with open(output_file, "wb") as f:
+        f.write(orjson.dumps(record.to_dict(), option=JSON_OPTIONS, default=to_serializable))
+    return output_file
 
 
-def parse_single_log(path: Path) -> Dict[str, Any]:
-    record: Dict[str, Any] = {"file": path.name}
+def extract_record(
+    path: StrPath, parser: str = DEFAULT_PARSER, name: Optional[str] = None
+) -> Record:
+    if name is None:
+        name = os.path.basename(path)
     try:
-        data = ccread(str(path))
+        data = get_reader(parser)(os.fspath(path))
     except Exception as exc:
-        logging.error(f"[Gaussian {path} ERROR] Encountered error when parsing: {str(exc)}")
-        record["error"] = str(exc)
-        return record
+        logging.error("[Gaussian %s ERROR] Encountered error when parsing: %s", path, exc)
+        return Record(file=name, error=str(exc))
 
     if data is None:
-        logging.error(f"[Gaussian {path} ERROR] cclib failed to parse the file.")
-        record["error"] = "cclib failed to parse the file."
-        return record
-
-    scfenergies = safe_get(data, "scfenergies")
+        logging.error("[Gaussian %s ERROR] cclib failed to parse the file.", path)
+        return Record(file=name, error="cclib failed to parse the file.")
+
+    # cclib stores parsed values as plain instance attributes; read them all
+    # from one dict instead of a getattr per field.
+    attrs = vars(data)
+    if parser != "auto" and attrs.keys() <= {"metadata"}:
+        # A forced parser "succeeds" on any file, but finds nothing in a
+        # log of another format (or an empty one)
+        logging.error("[Gaussian %s ERROR] cclib failed to parse the file.", path)
+        return Record(file=name, error="cclib failed to parse the file.")
+    scfenergies = attrs.get("scfenergies")
     scfenergies_au = (
-        [float(e) / EV_PER_HARTREE for e in scfenergies] if scfenergies is not None else None
+        np.multiply(scfenergies, HARTREE_PER_EV, dtype=np.float64).tolist()
+        if scfenergies is not None
+        else None
     )
 
-    dipole_vectors = safe_get(data, "moments")
+    dipole_vectors = attrs.get("moments")
     dipole_vector = dipole_vectors[1] if dipole_vectors and len(dipole_vectors) > 1 else None
     dipole_moment = None
     if dipole_vector is not None:
+        x, y, z = np.asarray(dipole_vector[:3], dtype=np.float64).tolist()
         dipole_moment = {
-            "x": float(dipole_vector[0]),
-            "y": float(dipole_vector[1]),
-            "z": float(dipole_vector[2]),
-            "total": float(
-                (dipole_vector[0] ** 2 + dipole_vector[1] ** 2 + dipole_vector[2] ** 2) ** 0.5
-            ),
+            "x": x,
+            "y": y,
+            "z": z,
+            "total": math.hypot(x, y, z),
         }
 
-    mulliken = safe_get(data, "mulliken_charges")
-    atomcoords = safe_get(data, "atomcoords")
-
-    record.update(
-        {
-            "metadata": safe_get(data, "metadata") or {},
-            "charge": float(safe_get(data, "charge"))
-            if safe_get(data, "charge") is not None
-            else None,
-            "multiplicity": int(safe_get(data, "mult"))
-            if safe_get(data, "mult") is not None
-            else None,
-            "nbasis": int(safe_get(data, "nbasis"))
-            if safe_get(data, "nbasis") is not None
-            else None,
-            "natoms": int(atomcoords[-1].shape[0]) if atomcoords is not None else None,
-            "scf_energies_au": scfenergies_au,
-            "final_scf_energy_au": scfenergies_au[-1] if scfenergies_au else None,
-            "vibrations": {
-                "frequencies_cm-1": to_python(safe_get(data, "vibfreqs")),
-                "ir_intensities_km/mol": to_python(safe_get(data, "vibirs")),
-                "force_constants_mDyneA": to_python(safe_get(data, "vibfconsts")),
-                "reduced_masses_amu": to_python(safe_get(data, "vibredmass")),
-            },
-            "dipole_moment_debye": dipole_moment,
-            "mulliken_charges": [float(x) for x in mulliken[-1]]
-            if mulliken is not None
-            else None,
-            "zpe_au": float(safe_get(data, "zpve")) if safe_get(data, "zpve") is not None else None,
-            "atom_numbers": to_python(safe_get(data, "atomnos")),
-            "final_geometry_angstrom": to_python(atomcoords[-1]) if atomcoords is not None else None,
-        }
+    mulliken = attrs.get("mulliken_charges")
+    atomcoords = attrs.get("atomcoords")
+
+    return Record(
+        file=name,
+        metadata=attrs.get("metadata") or {},
+        charge=_opt_float(attrs.get("charge")),
+        multiplicity=_opt_int(attrs.get("mult")),
+        nbasis=_opt_int(attrs.get("nbasis")),
+        natoms=int(atomcoords[-1].shape[0]) if atomcoords is not None else None,
+        scf_energies_au=scfenergies_au,
+        final_scf_energy_au=scfenergies_au[-1] if scfenergies_au else None,
+        vibrations={
+            "frequencies_cm-1": attrs.get("vibfreqs"),
+            "ir_intensities_km/mol": attrs.get("vibirs"),
+            "force_constants_mDyneA": attrs.get("vibfconsts"),
+            "reduced_masses_amu": attrs.get("vibredmass"),
+        },
+        dipole_moment_debye=dipole_moment,
+        mulliken_charges=np.asarray(mulliken[-1], dtype=np.float64).tolist()
+        if mulliken is not None
+        else None,
+        zpe_au=_opt_float(attrs.get("zpve")),
+        atom_numbers=attrs.get("atomnos"),
+        final_geometry_angstrom=np.ascontiguousarray(atomcoords[-1])
+        if atomcoords is not None
+        else None,
     )
-    return record
 
 
 def discover_files(directory: Path, pattern: str) -> List[Path]:
@@ -165,32 +445,90 @@ def discover_files(directory: Path, pattern: str) -> List[Path]:
         raise FileNotFoundError(f"Input directory does not exist: {directory}")
     if not directory.is_dir():
         raise NotADirectoryError(f"Input path is not a directory: {directory}")
-    return sorted(directory.glob(pattern))
-
-
-def determine_output_path(directory: Path, output_arg: Optional[Path]) -> Path:
+    if os.sep in pattern or "/" in pattern or "**" in pattern:
+        # Patterns that reach into subdirectories still need pathlib's glob
+        return sorted(directory.glob(pattern))
+    # A single readdir pass; DirEntry.is_file() uses the cached d_type, so no
+    # Path objects or extra stat() calls are made for non-matching entries.
+    with os.scandir(directory) as it:
+        names = [entry.name for entry in it if fnmatch.fnmatch(entry.name, pattern) and entry.is_file()]
+    names.sort()
+    return [directory / name for name in names]
+
+
+def resolve_output_format(format_arg: Optional[str], output_arg: Optional[Path]) -> str:
+    suffix = output_arg.suffix.lower().lstrip(".") if output_arg is not None else ""
+    if format_arg is None:
+        # Keep "-o results.json" producing a JSON array as it always has
+        return "json" if suffix == "json" else DEFAULT_FORMAT
+    if suffix in FORMAT_CHOICES and suffix != format_arg:
+        logging.warning("Writing %s output to %s despite its .%s suffix", format_arg, output_arg, suffix)
+    return format_arg
+
+
+def determine_output_path(
+    directory: Path, output_arg: Optional[Path], output_format: str = DEFAULT_FORMAT
+) -> Path:
     if output_arg is not None:
         return output_arg
     output_dir = Path.cwd() / "out_molecules_json"
     output_dir.mkdir(parents=True, exist_ok=True)
-    return output_dir / "out_molecules.json"
+    return output_dir / f"out_molecules.{output_format}"
+
+
+def write_json_array(f: IO[bytes], records: Iterable[Record]) -> int:
+    # Stream records into the JSON array as they arrive instead of
+    # materializing the whole list and its serialized string in memory.
+    count = 0
+    f.write(b"[\n")
+    for record in records:
+        if count:
+            f.write(b",\n")
+        f.write(orjson.dumps(record.to_dict(), option=JSON_OPTIONS, default=to_serializable))
+        count += 1
+    f.write(b"\n]")
+    return count
+
+
+def write_json_lines(f: IO[bytes], records: Iterable[Record]) -> int:
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+    count = 0
+    for record in records:
+        f.write(orjson.dumps(record.to_dict(), option=option, default=to_serializable))
+        count += 1
+    return count
+
+
+def progress(iterable: Iterable[Any], total: int) -> Iterable[Any]:
+    # Redraw at most twice a second / every 0.5% of files, and skip the bar
+    # entirely when stderr is redirected to a file.
+    return tqdm(
+        iterable,
+        total=total,
+        desc="Processing log files",
+        unit="file",
+        mininterval=0.5,
+        miniters=max(1, total // 200),
+        smoothing=0.01,
+        disable=not sys.stderr.isatty(),
+    )
 
 
-def parse_directory(directory: Path, pattern: str) -> List[Dict[str, Any]]:
+def parse_directory(directory: Path, pattern: str) -> List[Record]:
     files = discover_files(directory, pattern)
     if not files:
         print(f"No files matched '{pattern}' in {directory}")
         return []
-    records: List[Dict[str, Any]] = []
-    for path in tqdm(files, desc="Processing log files", unit="file"):
+    records: List[Record] = []
+    for path in progress(files, len(files)):
         records.append(parse_single_log(path))
     return records
 
 
-def normalize_records(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def normalize_records(records: Iterable[Record]) -> List[Dict[str, Any]]:
     normalized: List[Dict[str, Any]] = []
     for record in records:
-        normalized.append({key: to_serializable(value) for key, value in record.items()})
+        normalized.append({key: to_serializable(value) for key, value in record.to_dict().items()})
     return normalized
 
 
@@ -206,11 +544,48 @@ def send_discord_notification(message: str) -> None:
         if response.status_code == 204:
             logging.info("Discord notification sent successfully")
         else:
-            logging.error(f"Failed to send Discord notification: {response.status_code}")
+            logging.error("Failed to send Discord notification: %s", response.status_code)
     except ImportError:
         logging.warning("requests not installed, skipping Discord notification")
     except Exception as e:
-        logging.error(f"Failed to send Discord notification: {e}")
+        logging.error("Failed to send Discord notification: %s", e)
+
+
+def _init_worker(log_queue: Any, parser: str) -> None:
+    # Worker processes hand their log records to the parent's QueueListener
+    # instead of writing to the log files themselves.
+    logger = logging.getLogger()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+    # INFO is the lowest level the parent's handlers write; filtering here
+    # keeps QueueHandler from formatting and pickling records nobody emits
+    logger.setLevel(logging.INFO)
+    # Import cclib before the first task so every task runs at full speed
+    get_reader(parser)
+
+
+def get_mp_context() -> Any:
+    # With forkserver, cclib is imported once in the server process and every
+    # worker is forked from that warm interpreter.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(["__main__", "cclib.io"])
+        return ctx
+    return multiprocessing.get_context()
+
+
+def create_executor(log_queue: Any, parser: str = DEFAULT_PARSER) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=get_mp_context(),
+        initializer=_init_worker,
+        initargs=(log_queue, parser),
+    )
+
+
+def compute_chunksize(n_files: int) -> int:
+    return max(1, n_files // (8 * (os.cpu_count() or 1)))
 
 
 def main() -> None:
@@ -233,44 +608,58 @@ def main() -> None:
     error_handler.setFormatter(formatter)
     logger.addHandler(error_handler)
 
+    # Worker processes log through this queue; the listener is the only writer
+    log_queue = get_mp_context().Queue(-1)
+    listener = QueueListener(log_queue, info_handler, error_handler, respect_handler_level=True)
+    listener.start()
+    try:
+        run(log_queue)
+    finally:
+        listener.stop()
+
+
+def run(log_queue: Any) -> None:
     parser = build_argument_parser()
     args = parser.parse_args()
 
     input_dir = args.input_dir.expanduser().resolve()
 
-    logging.info(f"Starting parsing process for directory: {input_dir}")
+    logging.info("Starting parsing process for directory: %s", input_dir)
 
     files = discover_files(input_dir, args.pattern)
     if not files:
-        logging.warning(f"No files matched '{args.pattern}' in {input_dir}")
+        logging.warning("No files matched '%s' in %s", args.pattern, input_dir)
         print(f"No files matched '{args.pattern}' in {input_dir}")
         return
 
-    logging.info(f"Found {len(files)} files to process")
+    logging.info("Found %d files to process", len(files))
+
+    cache_dir = None
+    if not args.no_cache:
+        cache_dir = args.cache_dir.expanduser().resolve()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    jobs = plan_jobs(files, cache_dir, args.parser)
 
+    chunksize = compute_chunksize(len(files))
     if args.separate:
         output_dir = Path.cwd() / "out_molecules_json"
         output_dir.mkdir(parents=True, exist_ok=True)
-        with ThreadPoolExecutor() as executor:
-            futures = {executor.submit(parse_single_log, path): path for path in files}
-            for future in tqdm(as_completed(futures), total=len(files), desc="Processing log files", unit="file"):
-                path = futures[future]
-                record = future.result()
-                normalized = {key: to_serializable(value) for key, value in record.items()}
-                output_file = output_dir / f"{path.stem}.cclib.json"
-                output_file.write_text(json.dumps(normalized, indent=2, ensure_ascii=False))
+        task = partial(parse_and_serialize, output_dir=os.fspath(output_dir), parser=args.parser)
+        with create_executor(log_queue, args.parser) as executor:
+            results = executor.map(task, jobs, chunksize=chunksize)
+            for _ in progress(results, len(files)):
+                pass
     else:
-        output_path = determine_output_path(input_dir, args.output)
-        records = []
-        with ThreadPoolExecutor() as executor:
-            futures = {executor.submit(parse_single_log, path): path for path in files}
-            for future in tqdm(as_completed(futures), total=len(files), desc="Processing log files", unit="file"):
-                records.append(future.result())
-        normalized = normalize_records(records)
-        output_path.write_text(json.dumps(normalized, indent=2, ensure_ascii=False))
-        print(f"Wrote {len(normalized)} records to {output_path}")
-
-    logging.info(f"Parsing completed successfully. Processed {len(files)} files.")
+        output_format = resolve_output_format(args.format, args.output)
+        output_path = determine_output_path(input_dir, args.output, output_format)
+        parse = partial(run_job, parser=args.parser)
+        write_records = write_json_lines if output_format == "jsonl" else write_json_array
+        with create_executor(log_queue, args.parser) as executor, output_path.open("wb") as f:
+            results = executor.map(parse, jobs, chunksize=chunksize)
+            count = write_records(f, progress(results, len(files)))
+        print(f"Wrote {count} records to {output_path}")
+
+    logging.info("Parsing completed successfully. Processed %d files.", len(files))
     send_discord_notification(f"Gaussian log parsing completed. Processed {len(files)} files in {input_dir}.")
 
 
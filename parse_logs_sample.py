@@ -16,7 +16,7 @@ def main():
         raise RuntimeError("cclib failed to parse the file.")
 
     def get(obj, name, default=None):
-        return getattr(obj, name, default) if hasattr(obj, name) else default
+        return getattr(obj, name, default)
 
     EV_PER_HARTREE = 27.211386245988
 